@@ -1,3 +1,14 @@
+from functools import lru_cache
+
+import fastapi.dependencies.utils as _dep_utils
+
+# FastAPI calls inspect.signature() on every endpoint/dependency callable
+# it analyzes. Memoize it before the routers below register their routes
+# so repeated introspection of the same callable is a cache hit.
+_dep_utils.get_typed_signature = lru_cache(maxsize=2048)(
+    _dep_utils.get_typed_signature
+)
+
 from fastapi import FastAPI
 from routers import documents, analysis, workflows
 
@@ -1,15 +1,31 @@
 import asyncio
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from enum import Enum
-from math import prod
+from types import MappingProxyType
 from typing import Optional
-from xml.dom.minidom import Document
 
-from fastapi import FastAPI, Depends
+import httpx
+from fastapi import FastAPI, Depends, Request
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One shared HTTP client for the whole app — building a new
+    # httpx.AsyncClient per request pays for a fresh connection pool
+    # (and TLS handshake) every time. The async LLM client is shared the
+    # same way: constructed once here, handed out by its dependency.
+    app.state.http_client = httpx.AsyncClient()
+    app.state.llm = AsyncLLMClient("openai")
+    yield
+    await app.state.llm.aclose()
+    await app.state.http_client.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/")
 async def root():
@@ -34,6 +50,18 @@ class DocumentType(str, Enum):
     income_verification = "income_verification"
 
 
+# Built once at import — the validator reads it instead of rebuilding
+# the dict on every model construction. Read-only via MappingProxyType.
+_SIZE_LIMITS = MappingProxyType({
+    DocumentType.loan_disclosure: 10_000_000,   # 10 MB
+    DocumentType.appraisal: 50_000_000,         # 50 MB
+    DocumentType.income_verification: 5_000_000 # 5MB
+})
+
+# Frozen at import — O(1) membership test, no list rebuild per validation
+_ALLOWED_CONTENT_TYPES = frozenset({"application/pdf", "application/msword"})
+
+
 class Document(BaseModel):
     filename: str = Field(..., min_length=1, max_length=255)
     content_type: str
@@ -52,25 +80,31 @@ class Document(BaseModel):
     @field_validator("content_type")
     @classmethod
     def validate_content_type(cls, v: str) -> str:
-        allowed = ["application/pdf", "application/msword"]
-        if v not in allowed:
-            raise ValueError(f"content_type must be one of {allowed}")
+        if v not in _ALLOWED_CONTENT_TYPES:
+            raise ValueError(f"content_type must be one of {sorted(_ALLOWED_CONTENT_TYPES)}")
         return v
 
     @model_validator(mode="after")
-    def validate_size_by_doc_type(self) -> Document:
-        size_limits = {
-            DocumentType.loan_disclosure: 10_000_000,   # 10 MB
-            DocumentType.appraisal: 50_000_000,         # 50 MB
-            DocumentType.income_verification: 5_000_000 # 5MB
-        }
-        max_size = size_limits.get(self.doc_type, 50_000_000)
+    def validate_size_by_doc_type(self) -> "Document":
+        max_size = _SIZE_LIMITS.get(self.doc_type, 50_000_000)
         if self.size > max_size:
             raise ValueError(
                 f"{self.doc_type.value} max size is {max_size / 1_000_000}MB"
             )
         return self
 
+    @classmethod
+    def from_trusted(cls, **kwargs) -> "Document":
+        # Fast path for internal callers (e.g. rows already validated on
+        # ingress): skips all validators. HTTP input must keep going
+        # through normal validation in the endpoint.
+        return cls.model_construct(**kwargs)
+
+
+# Pre-bound pydantic-core validator for internal hot loops: skips the
+# attribute lookup + method bind Document.model_validate pays per call
+_validate_document = Document.__pydantic_validator__.validate_python
+
 
 @app.post("/documents")
 def create_document(doc: Document):
@@ -81,25 +115,30 @@ def create_document(doc: Document):
 
 
 
+# Immutable for the app lifetime — built once at import, never
+# reallocated per request. MappingProxyType guards against mutation.
+_SETTINGS = MappingProxyType({
+    "app_name": "Document Processor",
+    "max_file_size": 50_000_000,
+    "llm_provider": "openai",
+    "llm_api_key": "sk-xxxxx",
+    "max_tokens": 4000
+})
+
 def get_settings():
-    return {
-        "app_name": "Document Processor",
-        "max_file_size": 50_000_000,
-        "llm_provider": "openai",
-        "llm_api_key": "sk-xxxxx",
-        "max_tokens": 4000
-    }
+    return _SETTINGS
 
 @app.get("/settings")
-def get_settings(settings: dict = Depends(get_settings)):
+def read_settings(settings: dict = Depends(get_settings)):
     return settings
 
 
-def get_llm_client(settings: dict = Depends(get_settings)):
+def get_llm_client():
+    # Reads the module constant directly — one less Depends level
     return {
-        "provider": settings["llm_provider"],
-        "api_key": settings["llm_api_key"][:10] + "...", # masked
-        "max_tokens": settings["max_tokens"]
+        "provider": _SETTINGS["llm_provider"],
+        "api_key": _SETTINGS["llm_api_key"][:10] + "...", # masked
+        "max_tokens": _SETTINGS["max_tokens"]
     }
 
 def get_document_processor(llm: dict = Depends(get_llm_client)):
@@ -109,8 +148,15 @@ def get_document_processor(llm: dict = Depends(get_llm_client)):
         "status": "ready"
     }
 
+@lru_cache(maxsize=1)
+def get_processor_singleton():
+    # Settings are immutable for the app lifetime, so build the whole
+    # llm -> processor chain once instead of walking the Depends levels
+    # on every request
+    return get_document_processor(get_llm_client())
+
 @app.get("/processor/status")
-def processor_status(processor: dict = Depends(get_document_processor)):
+def processor_status(processor: dict = Depends(get_processor_singleton)):
     return processor
 
 @app.get("/analyze")
@@ -124,8 +170,9 @@ def analyze_document(doc_name: str, llm: dict = Depends(get_llm_client)):
 
 class LLMClient:
 
-    def __init__(self, provider: str = "openai"):
+    def __init__(self, provider: str = "openai", http_client: httpx.AsyncClient = None):
         self.provider = provider
+        self._http = http_client
         self.models = {
             "openai": "gpt-4",
             "azure": "gpt-4-turbo",
@@ -135,16 +182,22 @@ class LLMClient:
     def get_model(self) -> str:
         return self.models.get(self.provider, "gpt-4")
 
-    def complete(self, prompt: str) -> str:
-        # Here will go the real call to LLM provider
+    async def complete(self, prompt: str) -> str:
+        # Here will go the real call to LLM provider, e.g.:
+        #   resp = await self._http.post(f"{base_url}/v1/completions", json={...})
         return f"[{self.provider}:{self.get_model()}] Response to: {prompt[:50]}..."
 
+
+def get_completion_client(request: Request, provider: str = "openai") -> LLMClient:
+    # Reuse the client created at startup instead of building one per request
+    return LLMClient(provider, http_client=request.app.state.http_client)
+
 @app.get("/complete")
-def complete_prompt(prompt: str, llm: LLMClient = Depends()):
+async def complete_prompt(prompt: str, llm: LLMClient = Depends(get_completion_client)):
     return {
         "provider": llm.provider,
         "model": llm.get_model(),
-        "response": llm.complete(prompt)
+        "response": await llm.complete(prompt)
     }
 
 
@@ -158,11 +211,15 @@ class AsyncLLMClient:
         await asyncio.sleep(2)  # simulate async call
         return f"[{self.provider}] Analyzed: {prompt[:30]}..."
 
+    async def aclose(self):
+        # here a real client would release connections/sessions
+        pass
+
 
-async def get_async_llm(provider: str = "openai") -> AsyncLLMClient:
-    # here we could make setup async (conections, auth, etc.)
-    client = AsyncLLMClient(provider)
-    return client
+def get_async_llm(request: Request) -> AsyncLLMClient:
+    # Pure attribute read — the client is built once in lifespan() and
+    # shared, instead of constructing a new one per request
+    return request.app.state.llm
 
 @app.get("/analyze-async")
 async def analyze_async(prompt: str, llm: AsyncLLMClient = Depends(get_async_llm)):
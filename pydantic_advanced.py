@@ -1,9 +1,21 @@
+import json
+from functools import cached_property, lru_cache
 from typing import Optional
 
-from pydantic import BaseModel, Field, create_model, computed_field
+from pydantic import BaseModel, ConfigDict, Field, create_model, computed_field
 from datetime import datetime
 from enum import Enum
 
+# The real public surface — everything else here is demo material
+__all__ = [
+    "DocumentAnalysis",
+    "ExtractedField",
+    "ExtractedEntity",
+    "LoanAnalysis",
+    "create_extraction_model",
+    "build_field",
+]
+
 
 class Priority(str, Enum):
     low = "low"
@@ -17,36 +29,6 @@ class Workflow(BaseModel):
     priority: Priority
     created_at: datetime = Field(default_factory=datetime.now)
 
-# create instance
-workflow = Workflow(id=1, name="Loan Analysis", priority=Priority.high)
-
-# model_dump() -> Convert Pydantic model to dictionary
-print("=== model_dump() ===")
-print(workflow.model_dump())
-
-# model_dump() with options
-print("\n=== model_dump(exclude) ===")
-print(workflow.model_dump(exclude={"created_at"}))
-
-print("\n=== model_dump(mode='json') ===")
-print(workflow.model_dump(mode="json"))  # Serialize datetime to string
-
-# model_validate() - Create instance from dict
-print("\n=== model_validate() ===")
-data = {
-    "id": 2,
-    "name": "Risk Assessment",
-    "priority": "medium"
-}
-workflow2 = Workflow.model_validate(data)
-print(workflow2)
-
-# from JSON string
-print("\n=== model_validate_json() ===")
-json_str = '{"id": 3, "name": "Compliance Check", "priority": "low"}'
-workflow3 = Workflow.model_validate_json(json_str)
-print(workflow3)
-
 
 class ExtractedField(BaseModel):
     name: str
@@ -66,37 +48,6 @@ class DocumentAnalysis(BaseModel):
     raw_text: Optional[str] = None
 
 
-# Create nested structure
-analysis = DocumentAnalysis(
-    doc_id=1,
-    filename="loan_disclosure.pdf",
-    entities=[
-        ExtractedEntity(
-            entity_type="borrower",
-            fields=[
-                ExtractedField(name="name", value="John Doe", confidence=0.98),
-                ExtractedField(name="ssn_last4", value="1234", confidence=0.95),
-            ]
-        ),
-        ExtractedEntity(
-            entity_type="loan",
-            fields=[
-                ExtractedField(name="amount", value=450000, confidence=0.99),
-                ExtractedField(name="rate", value=6.5, confidence=0.97),
-            ]
-        )
-    ]
-)
-
-print("\n=== Nested Model ===")
-print(analysis.model_dump(mode="json"))
-
-# Access to nested data
-print(f"\n=== Direct Access ===")
-print(f"Borrower name: {analysis.entities[0].fields[0].value}")
-print(f"Loan amount: {analysis.entities[1].fields[0].value}")
-
-
 # User defines these fields in the Cape UI
 user_defined_schema = {
     "account_number": (str, Field(..., description="Account identifier")),
@@ -105,30 +56,10 @@ user_defined_schema = {
     "is_active": (bool, True),  # Con default
 }
 
-# Create model dinamically
+# Create model dinamically; rebuild eagerly so the pydantic-core
+# validator/serializer are constructed now, not on the first request
 DynamicAccount = create_model("DynamicAccount", **user_defined_schema)
-
-# Use it as a normal model
-account = DynamicAccount(
-    account_number="ACC-12345",
-    owner_name="John Doe",
-    balance=15000.50
-)
-
-print("\n=== Dynamic Model ===")
-print(account)
-print(account.model_dump())
-
-# Validation works same
-print("\n=== Validation still works ===")
-try:
-    bad_account = DynamicAccount(
-        account_number="ACC-999",
-        owner_name="",  # Fail min_length
-        balance=-100    # Fail ge=0
-    )
-except Exception as e:
-    print(f"Validation error: {e}")
+DynamicAccount.model_rebuild(force=True)
 
 
 # This comes from the UI/API of Cape - what user defined
@@ -141,56 +72,68 @@ schema_from_api = {
     ]
 }
 
+# Hoisted to module scope so build_field doesn't reallocate them per call
+_TYPE_MAPPING = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+}
+
+# (key in the JSON schema, keyword Field() expects)
+_CONSTRAINT_MAP = (
+    ("min", "ge"),
+    ("max", "le"),
+    ("min_length", "min_length"),
+    ("max_length", "max_length"),
+)
+
 def build_field(field_def: dict) -> tuple:
     """Convert JSON field definition to tuple for create_model()"""
-    type_mapping = {
-        "str": str,
-        "int": int,
-        "float": float,
-        "bool": bool,
-    }
-    python_type = type_mapping[field_def["type"]]
+    python_type = _TYPE_MAPPING[field_def["type"]]
 
-    # Build Field constraints
-    field_kwargs = {}
-    if "min" in field_def:
-        field_kwargs["ge"] = field_def["min"]
-    if "max" in field_def:
-        field_kwargs["le"] = field_def["max"]
-    if "min_length" in field_def:
-        field_kwargs["min_length"] = field_def["min_length"]
+    # Build Field constraints from the table instead of an if-cascade
+    field_kwargs = {
+        field_kw: field_def[schema_key]
+        for schema_key, field_kw in _CONSTRAINT_MAP
+        if schema_key in field_def
+    }
 
     # Required vs Optional
     if field_def.get("required", True):
         return python_type, Field(..., **field_kwargs)
     else:
-        default = field_kwargs.get("default")
+        default = field_def.get("default")
         return python_type | None, Field(default, **field_kwargs)
 
-def create_extraction_model(schema: dict, model_name: str = "DynamicExtraction"):
-    """Create Pydantic model from JSON schema"""
+@lru_cache(maxsize=256)
+def _build_extraction_model(schema_key: str, model_name: str):
+    schema = json.loads(schema_key)
     fields = {}
     for field_def in schema["fields"]:
         fields[field_def["name"]] = build_field(field_def)
-    return create_model(model_name, **fields)
-
-# Create model from JSON schema
-LoanExtraction = create_extraction_model(schema_from_api, "LoanExtraction")
+    model = create_model(
+        model_name,
+        __config__=ConfigDict(defer_build=False),
+        **fields,
+    )
+    # Pay the pydantic-core build cost here, inside the cache, rather
+    # than lazily on the first validation of each new model
+    model.model_rebuild(force=True)
+    return model
 
-# Test with extracted data from document
-extracted_data = {
-    "loan_amount": 350000.00,
-    "interest_rate": 6.75,
-    "borrower_name": "Jane Smith",
-}
+def create_extraction_model(schema: dict, model_name: str = "DynamicExtraction"):
+    """Create Pydantic model from JSON schema.
 
-loan = LoanExtraction(**extracted_data)
-print("\n=== Dynamic Model from JSON Schema ===")
-print(loan.model_dump())
+    Building a model triggers the full pydantic-core schema construction,
+    which is expensive — so results are cached: resubmitting the same
+    schema returns the already-built class. Dicts aren't hashable, so the
+    schema is canonicalized to a sorted JSON string as the cache key.
+    """
+    return _build_extraction_model(json.dumps(schema, sort_keys=True), model_name)
 
-# See the generated schema
-print("\n=== Generated Schema ===")
-print(LoanExtraction.model_json_schema())
+# Create model from JSON schema
+LoanExtraction = create_extraction_model(schema_from_api, "LoanExtraction")
 
 
 # # # Computed Fields
@@ -200,15 +143,18 @@ class LoanAnalysis(BaseModel):
     annual_income: float = Field(..., gt=0)
     credit_score: int = Field(..., ge=300, le=850)
 
+    # cached_property: computed once per instance, then a plain attribute
+    # read — model_dump accesses both fields and risk_level reads the
+    # ratio again, so a bare property would compute the ratio twice
     @computed_field
-    @property
-    def debt_to_income_ratio(self) -> float:
+    @cached_property
+    def debt_to_income_ratio(self: "LoanAnalysis") -> float:
         """Ratio of debt vs income"""
         return round(self.loan_amount / self.annual_income, 2)
 
     @computed_field
-    @property
-    def risk_level(self) -> str:
+    @cached_property
+    def risk_level(self: "LoanAnalysis") -> str:
         """Risk level based on credit score"""
         if self.credit_score >= 750 and self.debt_to_income_ratio <= 3:
             return "low"
@@ -217,11 +163,111 @@ class LoanAnalysis(BaseModel):
         else:
             return "high"
 
-loan = LoanAnalysis(
-    loan_amount=350000,
-    annual_income=90000,
-    credit_score=720
-)
 
-print("\n=== Computed Fields ===")
-print(loan.model_dump())
\ No newline at end of file
+# Demo code — only runs when executed directly, not on import
+if __name__ == "__main__":
+    # create instance
+    workflow = Workflow(id=1, name="Loan Analysis", priority=Priority.high)
+
+    # model_dump() -> Convert Pydantic model to dictionary
+    print("=== model_dump() ===")
+    print(workflow.model_dump())
+
+    # model_dump() with options
+    print("\n=== model_dump(exclude) ===")
+    print(workflow.model_dump(exclude={"created_at"}))
+
+    print("\n=== model_dump(mode='json') ===")
+    print(workflow.model_dump(mode="json"))  # Serialize datetime to string
+
+    # model_validate() - Create instance from dict
+    print("\n=== model_validate() ===")
+    data = {
+        "id": 2,
+        "name": "Risk Assessment",
+        "priority": "medium"
+    }
+    workflow2 = Workflow.model_validate(data)
+    print(workflow2)
+
+    # from JSON string
+    print("\n=== model_validate_json() ===")
+    json_str = '{"id": 3, "name": "Compliance Check", "priority": "low"}'
+    workflow3 = Workflow.model_validate_json(json_str)
+    print(workflow3)
+
+    # Create nested structure
+    analysis = DocumentAnalysis(
+        doc_id=1,
+        filename="loan_disclosure.pdf",
+        entities=[
+            ExtractedEntity(
+                entity_type="borrower",
+                fields=[
+                    ExtractedField(name="name", value="John Doe", confidence=0.98),
+                    ExtractedField(name="ssn_last4", value="1234", confidence=0.95),
+                ]
+            ),
+            ExtractedEntity(
+                entity_type="loan",
+                fields=[
+                    ExtractedField(name="amount", value=450000, confidence=0.99),
+                    ExtractedField(name="rate", value=6.5, confidence=0.97),
+                ]
+            )
+        ]
+    )
+
+    print("\n=== Nested Model ===")
+    print(analysis.model_dump(mode="json"))
+
+    # Access to nested data
+    print(f"\n=== Direct Access ===")
+    print(f"Borrower name: {analysis.entities[0].fields[0].value}")
+    print(f"Loan amount: {analysis.entities[1].fields[0].value}")
+
+    # Use it as a normal model
+    account = DynamicAccount(
+        account_number="ACC-12345",
+        owner_name="John Doe",
+        balance=15000.50
+    )
+
+    print("\n=== Dynamic Model ===")
+    print(account)
+    print(account.model_dump())
+
+    # Validation works same
+    print("\n=== Validation still works ===")
+    try:
+        bad_account = DynamicAccount(
+            account_number="ACC-999",
+            owner_name="",  # Fail min_length
+            balance=-100    # Fail ge=0
+        )
+    except Exception as e:
+        print(f"Validation error: {e}")
+
+    # Test with extracted data from document
+    extracted_data = {
+        "loan_amount": 350000.00,
+        "interest_rate": 6.75,
+        "borrower_name": "Jane Smith",
+    }
+
+    loan = LoanExtraction(**extracted_data)
+    print("\n=== Dynamic Model from JSON Schema ===")
+    print(loan.model_dump())
+
+    # See the generated schema
+    print("\n=== Generated Schema ===")
+    print(LoanExtraction.model_json_schema())
+
+    loan_analysis = LoanAnalysis(
+        loan_amount=350000,
+        annual_income=90000,
+        credit_score=720
+    )
+
+    print("\n=== Computed Fields ===")
+    print(loan_analysis.model_dump())
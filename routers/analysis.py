@@ -7,14 +7,78 @@ router = APIRouter(
 )
 
 
+class BatchingLLM:
+    """Coalesces concurrent analysis prompts into one LLM call.
+
+    Handlers put (prompt, future) on a queue and await the future; a
+    background task drains up to max_batch items (or whatever arrived
+    within flush_interval) and makes a single batched provider call,
+    then resolves each future with its slice of the response. One
+    roundtrip per group instead of one per request.
+    """
+
+    def __init__(self, max_batch: int = 8, flush_interval: float = 0.01):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def complete(self, prompt: str) -> str:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker.done():
+            # (Re)start on the current loop. The batcher outlives app
+            # restarts (module-level instance), and each restart brings a
+            # fresh event loop — a worker bound to the old loop would
+            # never drain the queue, deadlocking every request.
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = loop.create_task(self._drain())
+        future = loop.create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                results = await self._call_batch([prompt for prompt, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _call_batch(self, prompts: list[str]) -> list[str]:
+        # One provider roundtrip for the whole batch, e.g.:
+        #   resp = await client.post("/v1/completions", json={"batch": prompts})
+        await asyncio.sleep(1)  # simulate a single batched LLM call
+        return [f"Analysis complete: {prompt[:40]}" for prompt in prompts]
+
+
+llm_batcher = BatchingLLM()
+
+
 @router.post("/{doc_id}")
 async def analyze_document(doc_id: int, prompt: str = "Summarize this document"):
-    # Simulate call to LLM
-    await asyncio.sleep(1)
+    result = await llm_batcher.complete(prompt)
     return {
         "doc_id": doc_id,
         "prompt": prompt,
-        "result": f"Analysis complete for document {doc_id}",
+        "result": result,
         "confidence": 0.95
     }
 
@@ -0,0 +1,54 @@
+from fastapi import HTTPException, Request
+
+
+class _CachedError:
+    """Marks a cache entry whose resolution already failed."""
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: Exception):
+        self.exc = exc
+
+
+def resolve_cached(fn, key, cache: dict, *args, **kwargs):
+    """Resolve fn once per key, caching failures as well as successes.
+
+    A failed resolution stores a _CachedError so later lookups with the
+    same key re-raise immediately instead of re-running fn (and whatever
+    chain hangs off it).
+    """
+    if key in cache:
+        hit = cache[key]
+        if isinstance(hit, _CachedError):
+            raise hit.exc
+        return hit
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as exc:
+        cache[key] = _CachedError(exc)
+        raise
+    cache[key] = result
+    return result
+
+
+def _request_cache(request: Request) -> dict:
+    # Cache scoped to one request, like FastAPI's own dependency cache —
+    # cross-request caching would pin deleted/role-changed users forever
+    # and grow without bound
+    cache = getattr(request.state, "dep_cache", None)
+    if cache is None:
+        cache = {}
+        request.state.dep_cache = cache
+    return cache
+
+
+def _load_user(user_id: int) -> dict:
+    # Stand-in for a real user lookup (DB/auth service)
+    if user_id <= 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {"user_id": user_id, "role": "analyst"}
+
+
+def get_current_user(request: Request, user_id: int) -> dict:
+    return resolve_cached(
+        _load_user, ("user", user_id), _request_cache(request), user_id
+    )
@@ -1,5 +1,8 @@
+import msgspec
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
+from itertools import count
 from typing import Optional
 from enum import Enum
 
@@ -27,30 +30,55 @@ class DocumentResponse(BaseModel):
     status: str
 
 
-# Fake database
-fake_db: list[dict] = []
+# Pre-bound pydantic-core entry points for internal hot paths (bulk
+# ingest, scripts): one attribute lookup + method bind paid at import
+# instead of on every call through Model.model_validate/model_dump
+_validate_doc_create = DocumentCreate.__pydantic_validator__.validate_python
+_dump_doc_resp = DocumentResponse.__pydantic_serializer__.to_python
+
+
+# msgspec mirror of DocumentResponse for the read-heavy list endpoint:
+# its C encoder goes struct -> bytes directly, skipping jsonable_encoder
+class DocumentResponseMsg(msgspec.Struct):
+    id: int
+    filename: str
+    doc_type: str
+    status: str
+
+
+# Fake database, keyed by id for O(1) lookup
+fake_db: dict[int, dict] = {}
+_next_id = count(1)
 
 
 @router.post("/", response_model=DocumentResponse)
 def create_document(doc: DocumentCreate):
+    new_id = next(_next_id)
     new_doc = {
-        "id": len(fake_db) + 1,
+        "id": new_id,
         "filename": doc.filename,
         "doc_type": doc.doc_type,
         "status": "pending"
     }
-    fake_db.append(new_doc)
-    return new_doc
+    fake_db[new_id] = new_doc
+    # Input was already validated via DocumentCreate, so skip the second
+    # validation pass FastAPI would run on the response
+    return DocumentResponse.model_construct(**new_doc)
 
 
-@router.get("/", response_model=list[DocumentResponse])
+@router.get("/")
 def list_documents():
-    return fake_db
+    # fake_db is only populated by create_document, which already validated
+    # via DocumentCreate — encode straight to JSON bytes, no re-validation
+    payload = msgspec.json.encode(
+        [DocumentResponseMsg(**doc) for doc in fake_db.values()]
+    )
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/{doc_id}", response_model=DocumentResponse)
+@router.get("/{doc_id}")
 def get_document(doc_id: int):
-    for doc in fake_db:
-        if doc["id"] == doc_id:
-            return doc
-    return {"error": "Not found"}
+    doc = fake_db.get(doc_id)
+    if doc is None:
+        return {"error": "Not found"}
+    return DocumentResponse.model_construct(**doc)
@@ -1,9 +1,15 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import count
 
+import msgspec
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from routers.dependencies import get_current_user
+
 router = APIRouter(
     prefix="/workflows",
     tags=["Workflows"]
@@ -31,36 +37,112 @@ class WorkflowResponse(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     created_by: int = Field(..., description="User ID of the creator")
 
-# Fake database
-fake_db: list[dict] = []
 
-# Dependency
-def get_current_user(user_id: int) -> dict:
-    return {"user_id": user_id, "role": "analyst"}
+# Pre-bound pydantic-core entry points for internal hot paths (bulk
+# ingest, scripts): one attribute lookup + method bind paid at import
+# instead of on every call through Model.model_validate/model_dump
+_validate_wf_create = WorkflowCreate.__pydantic_validator__.validate_python
+_dump_wf_resp = WorkflowResponse.__pydantic_serializer__.to_python
+
+
+# msgspec mirror of WorkflowResponse for the read-heavy list endpoint:
+# its C encoder goes struct -> bytes directly, skipping jsonable_encoder
+class WorkflowResponseMsg(msgspec.Struct):
+    id: int
+    name: str
+    doc_ids: list[int]
+    priority: str
+    status: str
+    created_by: int
+    created_at: datetime = msgspec.field(default_factory=datetime.now)
+
+# Fake database, stored column-wise (SoA): one list per field instead of
+# one dict per row, so listing N workflows walks contiguous lists rather
+# than N separate hash tables. _index maps id -> row for O(1) lookup.
+@dataclass
+class WorkflowStore:
+    ids: list[int] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    doc_ids_list: list[list[int]] = field(default_factory=list)
+    priorities: list[str] = field(default_factory=list)
+    statuses: list[str] = field(default_factory=list)
+    created_at: list[datetime] = field(default_factory=list)
+    created_by: list[int] = field(default_factory=list)
+    _index: dict[int, int] = field(default_factory=dict)
+
+    def add(self, name: str, doc_ids: list[int], priority: str, status: str,
+            created_by: int) -> tuple[int, datetime]:
+        new_id = next(_next_id)
+        self._index[new_id] = len(self.ids)
+        created = datetime.now()
+        self.ids.append(new_id)
+        self.names.append(name)
+        self.doc_ids_list.append(doc_ids)
+        self.priorities.append(priority)
+        self.statuses.append(status)
+        self.created_at.append(created)
+        self.created_by.append(created_by)
+        return new_id, created
+
+    def row(self, workflow_id: int) -> int | None:
+        return self._index.get(workflow_id)
+
+
+fake_db = WorkflowStore()
+_next_id = count(1)
 
 # Endpoints
 @router.post("/", response_model=WorkflowResponse)
 def create_workflow(workflow: WorkflowCreate, current_user: dict = Depends(get_current_user)):
-    new_workflow = {
-        "id": len(fake_db) + 1,
-        "name": workflow.name,
-        "doc_ids": workflow.doc_ids,
-        "priority": workflow.priority,
-        "status": "pending",
-        "created_by": current_user["user_id"]
-    }
-    fake_db.append(new_workflow)
-    return new_workflow
-
-
-@router.get("/", response_model=list[WorkflowResponse])
+    new_id, created = fake_db.add(
+        name=workflow.name,
+        doc_ids=workflow.doc_ids,
+        priority=workflow.priority,
+        status="pending",
+        created_by=current_user["user_id"],
+    )
+    # Input was already validated via WorkflowCreate, so skip the second
+    # validation pass FastAPI would run on the response
+    return WorkflowResponse.model_construct(
+        id=new_id,
+        name=workflow.name,
+        doc_ids=workflow.doc_ids,
+        priority=workflow.priority,
+        status="pending",
+        created_at=created,
+        created_by=current_user["user_id"],
+    )
+
+
+@router.get("/")
 def list_workflows():
-    return fake_db
+    # fake_db is only populated by create_workflow, which already validated
+    # via WorkflowCreate — zip the columns straight into JSON bytes
+    payload = msgspec.json.encode([
+        WorkflowResponseMsg(
+            id=i, name=n, doc_ids=d, priority=p, status=s,
+            created_by=b, created_at=c,
+        )
+        for i, n, d, p, s, c, b in zip(
+            fake_db.ids, fake_db.names, fake_db.doc_ids_list,
+            fake_db.priorities, fake_db.statuses,
+            fake_db.created_at, fake_db.created_by,
+        )
+    ])
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/{workflow_id}", response_model=WorkflowResponse)
+@router.get("/{workflow_id}")
 def get_workflow(workflow_id: int):
-    for workflow in fake_db:
-        if workflow["id"] == workflow_id:
-            return workflow
-    raise HTTPException(status_code=404, detail="Workflow not found")
+    row = fake_db.row(workflow_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return WorkflowResponse.model_construct(
+        id=fake_db.ids[row],
+        name=fake_db.names[row],
+        doc_ids=fake_db.doc_ids_list[row],
+        priority=fake_db.priorities[row],
+        status=fake_db.statuses[row],
+        created_at=fake_db.created_at[row],
+        created_by=fake_db.created_by[row],
+    )